@@ -1,15 +1,147 @@
 """Get the current meters on the AMI account from the local utility provider."""
 
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from logging import Logger, getLogger, StreamHandler
-import json
 
-import argparse
+import orjson
 import requests
-from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import HTTPError as Urllib3HTTPError
+from urllib3.util import Retry, Timeout
 
 LOGGER: Logger = getLogger(__name__)
 
+METER_TYPES = ("water", "electric", "gas")
+
+# Credentials read from the environment, or from the .env file if missing
+REQUIRED_ENV_VARS = ("UTILITY_USERNAME", "UTILITY_PASSWORD", "ACCOUNT_NUMBER")
+
+# AMI portal session reused across runs; the JWT is issued for 60 minutes
+SESSION_CACHE_PATH = os.path.join(
+    os.path.expanduser("~"), ".cache", "newberry-ami", "session.json"
+)
+SESSION_CACHE_LIFETIME = 55 * 60
+
+# (connect, read) timeouts in seconds; meter listings can take longer to return
+HTTP_TIMEOUT = (3, 5)
+METER_HTTP_TIMEOUT = (3, 15)
+
+# One pooled connection per parallel meter type request, plus the init request
+HTTP_POOL_CONNECTIONS = 4
+HTTP_POOL_MAXSIZE = 4
+
+# Retry transient failures with exponential backoff, honoring Retry-After
+HTTP_RETRY = Retry(
+    total=3,
+    backoff_factor=1.0,
+    status_forcelist=(500, 502, 503, 504),
+    allowed_methods=frozenset(["GET", "POST"]),
+    respect_retry_after_header=True,
+)
+
+DATA_VENDOR_INIT_HEADERS = {
+    "Content-Type": "application/json, charset=UTF-8",
+    "Accept": "application/json, text/javascript, */*",
+    "Origin": "https://my-nwbry.sensus-analytics.com",
+}
+
+# Meter request headers; the Referer is set on the session once per JWT token
+METER_HEADERS = {
+    "Accept": "application/json, text/javascript, */*; q=0.01",
+    "Origin": "https://my-nwbry.sensus-analytics.com",
+    "Accept-Encoding": "gzip, deflate, br, zstd",
+    "X-Requested-With": "XMLHttpRequest",
+    "Content-Type": "application/json; charset=UTF-8",
+}
+
+
+@dataclass(slots=True)
+class Meter:
+    """A meter on the AMI account."""
+
+    meter_id: str
+    meter_type: str
+    meter_address: str
+
+    def to_dict(self) -> dict:
+        """Get the meter in the script's JSON output format.
+
+        Returns:
+            dict: The meter keyed by meterId, meterType and meterAddress.
+        """
+        return {
+            "meterId": self.meter_id,
+            "meterType": self.meter_type,
+            "meterAddress": self.meter_address,
+        }
+
+
+def create_http_session() -> requests.Session:
+    """Create a requests session with connection pooling and retries.
+
+    Returns:
+        requests.Session: A requests session object.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_CONNECTIONS,
+        pool_maxsize=HTTP_POOL_MAXSIZE,
+        max_retries=HTTP_RETRY,
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def send_without_retries(session, request, timeout) -> requests.Response:
+    """Send a request once through the session's connection pool, without retries.
+
+    For optional requests whose failure is handled by the caller, where the
+    session's retry backoff would only add delay. Cookies set by the response
+    are not stored in the session.
+
+    Args:
+        session (requests.Session): A requests session object
+        request (requests.Request): The request to send
+        timeout (tuple): (connect, read) timeouts in seconds
+
+    Returns:
+        requests.Response: The response to the request.
+
+    Raises:
+        requests.RequestException: If the request could not be sent or answered.
+    """
+    prepared = session.prepare_request(request)
+    settings = session.merge_environment_settings(prepared.url, {}, None, None, None)
+    adapter = session.get_adapter(prepared.url)
+    try:
+        connection_pool = adapter.get_connection_with_tls_context(
+            prepared, settings["verify"], settings["proxies"], settings["cert"]
+        )
+        raw_response = connection_pool.urlopen(
+            prepared.method,
+            adapter.request_url(prepared, settings["proxies"]),
+            body=prepared.body,
+            headers=prepared.headers,
+            retries=False,
+            redirect=False,
+            preload_content=False,
+            decode_content=False,
+            timeout=Timeout(connect=timeout[0], read=timeout[1]),
+        )
+    except Urllib3HTTPError as error:
+        raise requests.ConnectionError(error, request=prepared) from error
+
+    response = adapter.build_response(prepared, raw_response)
+
+    # Read the body so the connection goes back to the pool, as Session.send does
+    response.content  # pylint: disable=pointless-statement
+    return response
+
 
 def create_utility_provider_session(session):
     """Create a PHP session with the local utility provider.
@@ -21,7 +153,8 @@ def create_utility_provider_session(session):
         None
     """
     utility_url = "https://utilitybilling.newberryfl.gov/utility/"
-    session.request("GET", utility_url, timeout=15)
+    response = session.request("GET", utility_url, timeout=HTTP_TIMEOUT)
+    response.raise_for_status()
 
 
 def authenticate_utility_provider_session(session, auth: dict) -> bool:
@@ -44,12 +177,22 @@ def authenticate_utility_provider_session(session, auth: dict) -> bool:
         "accessLevel": 11,
         "widgetName": "INITIAL",
     }
-    response = session.request("POST", utility_url, data=form_data, timeout=15)
+    response = session.request(
+        "POST", utility_url, data=form_data, timeout=HTTP_TIMEOUT
+    )
+    response.raise_for_status()
 
-    # Check if the JSON response.errors list is empty, or if the auth failed
-    if len(response.json()["errors"]) == 0:
+    # Check if the JSON response.errors list is empty, or if the auth failed.
+    # A body that opens with an empty top-level errors list is recognized
+    # without parsing; anything else is parsed.
+    if response.content.startswith(b'{"errors":[]'):
         return True
 
+    errors = orjson.loads(response.content)["errors"]
+    if len(errors) == 0:
+        return True
+
+    LOGGER.debug("\t- Authentication errors: %s", errors)
     return False
 
 
@@ -69,11 +212,35 @@ def get_jwt_token_from_utility_provider(session) -> str | None:
         "timeout": 60,
         "linkAccount": 0,
     }
-    response = session.request("POST", utility_url, data=form_data, timeout=15)
-    if "access_token" not in response.json():
-        return None
-    else:
-        return response.json()["access_token"]
+    response = session.request(
+        "POST", utility_url, data=form_data, timeout=HTTP_TIMEOUT
+    )
+    response.raise_for_status()
+    payload = orjson.loads(response.content)
+    return payload.get("access_token")
+
+
+def warm_data_vendor_connection(session) -> bool:
+    """Open a pooled connection to the data vendor ahead of time.
+
+    The TCP and TLS setup happens while the local utility provider login is
+    still in progress, so the data vendor requests start on a warm socket.
+
+    Args:
+        session (requests.Session): A requests session object
+
+    Returns:
+        bool: True if the connection was established, False otherwise.
+    """
+    data_vendor_url = "https://my-nwbry.sensus-analytics.com/"
+    try:
+        send_without_retries(
+            session, requests.Request("HEAD", data_vendor_url), HTTP_TIMEOUT
+        )
+    except requests.RequestException:
+        return False
+
+    return True
 
 
 def init_data_vendor_session(session, jwt_token: str) -> bool:
@@ -91,19 +258,15 @@ def init_data_vendor_session(session, jwt_token: str) -> bool:
     params = {
         "sso_auth": jwt_token,
     }
-    headers = {
-        "Content-Type": "application/json, charset=UTF-8",
-        "Accept": "application/json, text/javascript, */*",
-        "Origin": "https://my-nwbry.sensus-analytics.com",
-    }
     response = session.request(
         "POST",
         data_vendor_url,
         params=params,
-        headers=headers,
-        timeout=15,
+        headers=DATA_VENDOR_INIT_HEADERS,
+        timeout=HTTP_TIMEOUT,
         json=payload,
     )
+    response.raise_for_status()
     cookies = response.cookies.get_dict()
 
     if "JSESSIONID" not in cookies:
@@ -113,92 +276,173 @@ def init_data_vendor_session(session, jwt_token: str) -> bool:
 
 
 def get_meters_by_type(
-    session, jwt_token: str, account_number: str, meter_type: str
-) -> dict | None:
+    session, jwt_token: str, account_number: str, meter_type: str | None
+) -> list[Meter] | None:
     """Get the meters on the account by type.
 
+    With no meter type, all meters are requested at once, without retries, and
+    each meter's type is read from the device details instead.
+
     Args:
         session (requests.Session): Requests session object
         jwt_token (str): JWT token from the local utility provider
         account_number (str): Account number associated with the meters
-        meter_type (str): Type of meter to get (water, electric, gas)
+        meter_type (str | None): Type of meter to get (water, electric, gas), or None for all
 
     Returns:
-        dict | None: A dictionary of meters if successful, None otherwise.
+        list[Meter] | None: A list of meters if successful, None otherwise, including
+            when a device's type cannot be determined.
+
+    Raises:
+        requests.HTTPError: If the AMI portal rejects the request, e.g. 401 for an expired session.
+        requests.RequestException: If the request fails.
     """
     data_vendor_url = "https://my-nwbry.sensus-analytics.com/account/details"
     params = {
         "sso_auth": jwt_token,
     }
-    data = {"accountNumber": account_number, "meterTypeByValue": meter_type}
-    headers = {
-        "Accept": "application/json, text/javascript, */*; q=0.01",
-        "Referer": f"https://my-nwbry.sensus-analytics.com/main.html?sso_auth={jwt_token}",
-        "Origin": "https://my-nwbry.sensus-analytics.com",
-        "Accept-Encoding": "gzip, deflate, br, zstd",
-        "X-Requested-With": "XMLHttpRequest",
-        "Content-Type": "application/json; charset=UTF-8",
-    }
-    response = session.request(
-        "POST", data_vendor_url, json=data, headers=headers, params=params, timeout=15
-    )
-    response_json = response.json()
+    data = {"accountNumber": account_number}
+    if meter_type is None:
+        request = requests.Request(
+            "POST", data_vendor_url, json=data, headers=METER_HEADERS, params=params
+        )
+        response = send_without_retries(session, request, METER_HTTP_TIMEOUT)
+    else:
+        data["meterTypeByValue"] = meter_type
+        response = session.request(
+            "POST",
+            data_vendor_url,
+            json=data,
+            headers=METER_HEADERS,
+            params=params,
+            timeout=METER_HTTP_TIMEOUT,
+        )
+    response.raise_for_status()
+    response_json = orjson.loads(response.content)
     if response_json.get("operationSuccess") is not True:
         return None
 
     meters = []
-    if len(response_json.get("deviceIdList")) > 0:
-        for meter_id in response_json.get("deviceIdList"):
-            meters.append(
-                {
-                    "meterId": meter_id,
-                    "meterType": meter_type,
-                    "meterAddress": response_json.get("devices")
-                    .get(meter_id)
-                    .get("address")
-                    .get("line1"),
-                }
-            )
-            if response_json.get("devices").get(meter_id).get("address").get("line2"):
-                meters[-1]["meterAddress"] += (
-                    f" {response_json.get('devices').get(meter_id).get('address').get('line2')}"
-                )
+    devices = response_json.get("devices", {})
+    for meter_id in response_json.get("deviceIdList", ()):
+        device = devices[meter_id]
+        device_type = meter_type or str(device.get("meterType", "")).lower()
+        if device_type not in METER_TYPES:
+            return None
+        address = device["address"]
+        address_parts = [address["line1"]]
+        if address.get("line2"):
+            address_parts.append(address["line2"])
+        meters.append(Meter(meter_id, device_type, " ".join(address_parts)))
     if len(meters) == 0:
         return None
     return meters
 
 
-def main():
-    """Program entry point."""
-    # Add a handler for console output to the logger
-    LOGGER.addHandler(StreamHandler())
+def load_cached_session(session, username: str) -> str | None:
+    """Restore the AMI portal session cached by a previous run.
 
-    # If the user passed the -v flag, set the logging level to DEBUG
-    # Use argparse to handle program arguments
-    parser = argparse.ArgumentParser(
-        description="Get the current meters on the AMI account from the local utility provider."
-    )
-    parser.add_argument(
-        "-v", "--verbose", help="increase output verbosity", action="store_true"
-    )
-    args = parser.parse_args()
+    Args:
+        session (requests.Session): A requests session object
+        username (str): Username the cached session must belong to
 
-    if args.verbose:
-        LOGGER.setLevel("DEBUG")
-    else:
-        LOGGER.setLevel("INFO")
+    Returns:
+        str | None: The cached JWT token if still valid, None otherwise.
+    """
+    # Anything other than a well-formed, unexpired cache for this user is a miss
+    try:
+        with open(SESSION_CACHE_PATH, "rb") as cache_file:
+            cached = orjson.loads(cache_file.read())
+        if cached["username"] != username or cached["exp"] <= time.time():
+            return None
+        jwt_token = cached["jwt"]
+        cookies = [
+            (cookie["name"], cookie["value"], cookie["domain"], cookie["path"])
+            for cookie in cached["cookies"]
+        ]
+    except (OSError, orjson.JSONDecodeError, LookupError, TypeError):
+        return None
 
-    # Load the ENV file
-    load_dotenv()
+    if not isinstance(jwt_token, str) or not jwt_token:
+        return None
+    if not all(isinstance(field, str) for cookie in cookies for field in cookie):
+        return None
 
-    local_utility_auth: dict = {
-        "username": os.getenv("UTILITY_USERNAME"),
-        "password": os.getenv("UTILITY_PASSWORD"),
-        "account_number": os.getenv("ACCOUNT_NUMBER"),
+    for name, value, domain, path in cookies:
+        session.cookies.set(name, value, domain=domain, path=path)
+
+    return jwt_token
+
+
+def save_cached_session(session, username: str, jwt_token: str):
+    """Cache the AMI portal session so later runs can skip the login steps.
+
+    Args:
+        session (requests.Session): A requests session object
+        username (str): Username the session belongs to
+        jwt_token (str): JWT token from the local utility provider
+
+    Returns:
+        None
+    """
+    cached = {
+        "username": username,
+        "jwt": jwt_token,
+        "cookies": [
+            {
+                "name": cookie.name,
+                "value": cookie.value,
+                "domain": cookie.domain,
+                "path": cookie.path,
+            }
+            for cookie in session.cookies
+        ],
+        "exp": time.time() + SESSION_CACHE_LIFETIME,
     }
+    try:
+        os.makedirs(os.path.dirname(SESSION_CACHE_PATH), mode=0o700, exist_ok=True)
+        cache_fd = os.open(
+            SESSION_CACHE_PATH, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600
+        )
+        # The mode above only applies to new files, so tighten an existing one too
+        os.chmod(SESSION_CACHE_PATH, 0o600)
+        with os.fdopen(cache_fd, "wb") as cache_file:
+            cache_file.write(orjson.dumps(cached))
+    except OSError as error:
+        LOGGER.debug("\t- Unable to cache the AMI portal session: %s", error)
 
-    # Create a requests session to store cookies
-    session = requests.Session()
+
+def clear_cached_session():
+    """Remove the cached AMI portal session, if any.
+
+    Returns:
+        None
+    """
+    try:
+        os.remove(SESSION_CACHE_PATH)
+    except FileNotFoundError:
+        pass
+
+
+def start_ami_portal_session(session, auth: dict) -> str | None:
+    """Log in to the local utility provider and start a session with the AMI portal.
+
+    Args:
+        session (requests.Session): A requests session object
+        auth (dict): username and password for the local utility provider
+
+    Returns:
+        str | None: The JWT token if successful, None otherwise.
+    """
+    # Connect to the data vendor in the background while logging in. The thread
+    # is a daemon so a failed login exits without waiting on it.
+    data_vendor_warmup = {}
+    threading.Thread(
+        target=lambda: data_vendor_warmup.update(
+            connected=warm_data_vendor_connection(session)
+        ),
+        daemon=True,
+    ).start()
 
     # Generate the needed cookies for the local utility (PHPSESSID, UTILITY)
     LOGGER.debug(
@@ -210,12 +454,10 @@ def main():
     LOGGER.debug(
         "\x1b[1;33;20m[newberryfl.gov]\x1b[0m Authenticating with supplied username and password..."
     )
-    session_authenticated = authenticate_utility_provider_session(
-        session, local_utility_auth
-    )
+    session_authenticated = authenticate_utility_provider_session(session, auth)
     if not session_authenticated:
         LOGGER.error("Failed to authenticate with the local utility provider.")
-        return
+        return None
 
     # Get the JWT token from the local utility provider
     LOGGER.debug(
@@ -224,29 +466,201 @@ def main():
     jwt_token = get_jwt_token_from_utility_provider(session)
     if not jwt_token:
         LOGGER.error("Failed to get the JWT token from the local utility provider.")
-        return
+        return None
 
     # Get the session cookies from the data vendor using the JWT token
+    if not data_vendor_warmup.get("connected"):
+        LOGGER.debug("\t- AMI portal pre-connect not ready, connecting now.")
     LOGGER.debug(
         "\x1b[1;35;20m[sensus-analytics.com]\x1b[0m Starting session with AMI portal using token..."
     )
     data_vendor_cookies = init_data_vendor_session(session, jwt_token)
     if not data_vendor_cookies:
         LOGGER.error("Failed to get the cookies from the data vendor.")
-        return
+        return None
 
-    # Get the meters on the account
-    account_meters = []
-    for meter_type in ["water", "electric", "gas"]:
+    return jwt_token
+
+
+def get_account_meters(session, jwt_token: str, account_number: str) -> dict:
+    """Get the meters on the account for every meter type.
+
+    All meters are requested at once first. That listing is only used if the
+    AMI portal reports a type for each meter and more than one type comes
+    back, since a single type may mean the portal applied a default filter.
+    Otherwise each meter type is requested separately, in parallel.
+
+    Args:
+        session (requests.Session): Requests session object
+        jwt_token (str): JWT token from the local utility provider
+        account_number (str): Account number associated with the meters
+
+    Returns:
+        dict: Meters found for each meter type, keyed by meter type.
+    """
+    # Every meter request shares the same Referer, so build it once
+    session.headers["Referer"] = (
+        f"https://my-nwbry.sensus-analytics.com/main.html?sso_auth={jwt_token}"
+    )
+    LOGGER.debug(
+        "\x1b[1;35;20m[sensus-analytics.com]\x1b[0m Getting all meters on account %s...",
+        account_number,
+    )
+    try:
+        meters = get_meters_by_type(session, jwt_token, account_number, None)
+    except requests.HTTPError as error:
+        # An expired session is handled by the caller, anything else falls back
+        if error.response.status_code == 401:
+            raise
+        meters = None
+    except (
+        requests.RequestException,
+        orjson.JSONDecodeError,
+        LookupError,
+        AttributeError,
+        TypeError,
+    ):
+        # Unreachable, or an unexpected response shape
+        meters = None
+
+    if len({meter.meter_type for meter in meters or ()}) > 1:
+        meters_by_type = {meter_type: [] for meter_type in METER_TYPES}
+        for meter in meters:
+            meters_by_type[meter.meter_type].append(meter)
+        return meters_by_type
+
+    LOGGER.debug("\t- Combined listing unusable, requesting each meter type.")
+    for meter_type in METER_TYPES:
         LOGGER.debug(
             "\x1b[1;35;20m[sensus-analytics.com]\x1b[0m Getting all %s meters on account %s...",
             meter_type,
-            local_utility_auth.get("account_number"),
+            account_number,
         )
+    meters_by_type = {}
+    with ThreadPoolExecutor(max_workers=len(METER_TYPES)) as executor:
+        futures = {
+            executor.submit(
+                get_meters_by_type, session, jwt_token, account_number, meter_type
+            ): meter_type
+            for meter_type in METER_TYPES
+        }
+        for future in as_completed(futures):
+            meters_by_type[futures[future]] = future.result()
 
-        meters = get_meters_by_type(
-            session, jwt_token, local_utility_auth.get("account_number"), meter_type
+    return meters_by_type
+
+
+def load_account_meters(session, auth: dict) -> dict | None:
+    """Get the meters on the account, reusing the cached AMI portal session if possible.
+
+    Args:
+        session (requests.Session): A requests session object
+        auth (dict): username, password and account number for the local utility provider
+
+    Returns:
+        dict | None: Meters found for each meter type if successful, None otherwise.
+
+    Raises:
+        requests.RequestException: If a request fails after retries.
+        orjson.JSONDecodeError: If a response body is not JSON, e.g. an HTML error page.
+    """
+    # Reuse the AMI portal session from a previous run if it has not expired
+    username = auth.get("username")
+    account_number = auth.get("account_number")
+    jwt_token = load_cached_session(session, username)
+    session_from_cache = jwt_token is not None
+    if session_from_cache:
+        LOGGER.debug(
+            "\x1b[1;35;20m[sensus-analytics.com]\x1b[0m Reusing cached session with AMI portal..."
+        )
+    else:
+        jwt_token = start_ami_portal_session(session, auth)
+        if not jwt_token:
+            return None
+        save_cached_session(session, username, jwt_token)
+
+    meters_by_type = None
+    try:
+        meters_by_type = get_account_meters(session, jwt_token, account_number)
+    except (requests.RequestException, orjson.JSONDecodeError):
+        # A cached session the AMI portal no longer accepts needs a fresh login,
+        # whether it is rejected with a 401/403 or redirected to an HTML page
+        if not session_from_cache:
+            raise
+
+    # An expired session may also be rejected with operationSuccess false, which
+    # looks the same as no meters, so a cached session must produce some meters
+    if session_from_cache and not any((meters_by_type or {}).values()):
+        LOGGER.debug("\t- Cached session was not accepted, logging in again.")
+        clear_cached_session()
+        session.cookies.clear()
+        session.headers.pop("Referer", None)
+        jwt_token = start_ami_portal_session(session, auth)
+        if not jwt_token:
+            return None
+        save_cached_session(session, username, jwt_token)
+        meters_by_type = get_account_meters(session, jwt_token, account_number)
+
+    return meters_by_type
+
+
+def main():
+    """Program entry point."""
+    # Imported here so it is only loaded when the script is run
+    import argparse  # pylint: disable=import-outside-toplevel
+
+    # Add a handler for console output to the logger
+    LOGGER.addHandler(StreamHandler())
+
+    # If the user passed the -v flag, set the logging level to DEBUG
+    # Use argparse to handle program arguments
+    parser = argparse.ArgumentParser(
+        description="Get the current meters on the AMI account from the local utility provider."
+    )
+    parser.add_argument(
+        "-v", "--verbose", help="increase output verbosity", action="store_true"
+    )
+    args = parser.parse_args()
+
+    if args.verbose:
+        LOGGER.setLevel("DEBUG")
+    else:
+        LOGGER.setLevel("INFO")
+
+    # Load the ENV file, unless the credentials are already in the environment
+    if not all(key in os.environ for key in REQUIRED_ENV_VARS):
+        from dotenv import load_dotenv  # pylint: disable=import-outside-toplevel
+
+        load_dotenv()
+
+    local_utility_auth: dict = {
+        "username": os.getenv("UTILITY_USERNAME"),
+        "password": os.getenv("UTILITY_PASSWORD"),
+        "account_number": os.getenv("ACCOUNT_NUMBER"),
+    }
+
+    # Create a requests session to store cookies, with enough pooled connections
+    # for the meter type requests to run in parallel
+    session = create_http_session()
+
+    try:
+        meters_by_type = load_account_meters(session, local_utility_auth)
+    except requests.RequestException as error:
+        LOGGER.error("Request to the utility provider or AMI portal failed: %s", error)
+        return
+    except orjson.JSONDecodeError as error:
+        LOGGER.error(
+            "Unexpected non-JSON response from the utility provider or AMI portal: %s",
+            error,
         )
+        return
+    if meters_by_type is None:
+        return
+
+    # Report results in a stable order regardless of completion order
+    account_meters = []
+    for meter_type in METER_TYPES:
+        meters = meters_by_type[meter_type]
         if not meters:
             LOGGER.debug("\t- No meters of type '%s' found on the account.", meter_type)
             continue
@@ -257,13 +671,13 @@ def main():
             meter_type,
         )
         for meter in meters:
-            LOGGER.debug("\t\t- Meter ID: %s", meter["meterId"])
-            LOGGER.debug("\t\t- Meter Address: %s", meter["meterAddress"])
+            LOGGER.debug("\t\t- Meter ID: %s", meter.meter_id)
+            LOGGER.debug("\t\t- Meter Address: %s", meter.meter_address)
 
     # Print the meter listing in json format
-    output = {"meters": account_meters}
+    output = {"meters": [meter.to_dict() for meter in account_meters]}
     LOGGER.debug("\nJSON Output:")
-    LOGGER.info(json.dumps(output, indent=4))
+    LOGGER.info(orjson.dumps(output, option=orjson.OPT_INDENT_2).decode())
 
 
 if __name__ == "__main__":